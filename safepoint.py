@@ -110,45 +110,54 @@ class Database:
 # WindowsTerminalProvider (inlined)
 # ──────────────────────────────────────────────────────────────────────────────
 
+_JSONC_RE = re.compile(
+    r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
+    re.DOTALL|re.MULTILINE
+)
+
 class WindowsTerminalProvider:
     """Sets Windows Terminal backgroundImage via editing settings.json"""
 
     @staticmethod
     def comment_remover(text: str) -> str:
+        if '//' not in text and '/*' not in text:
+            return text
         def replacer(m):
             s = m.group(0)
             if s.startswith('/') : return " "
             return s
-        pattern = re.compile(
-            r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
-            re.DOTALL|re.MULTILINE
-        )
-        return re.sub(pattern, replacer, text)
+        return _JSONC_RE.sub(replacer, text)
 
     @staticmethod
     def set_background_image(path: str):
         fp = os.environ['LOCALAPPDATA'] + \
              r'\Packages\Microsoft.WindowsTerminal_8wekyb3d8bbwe\LocalState\settings.json'
-        with open(fp, 'r+', encoding='utf8') as jf:
+        with open(fp, 'r', encoding='utf8') as jf:
             raw = jf.read()
-            data = json.loads(WindowsTerminalProvider.comment_remover(raw))
-
-            # normalize profiles to dict if needed
-            profs = data.get('profiles')
-            if isinstance(profs, list):
-                data['profiles'] = {'defaults': {}, 'list': profs}
-                profs = data['profiles']
-
-            defaults = profs.get('defaults', {})
-            if path is None and 'backgroundImage' in defaults:
-                defaults.pop('backgroundImage')
-            else:
-                defaults['backgroundImage'] = path
-
-            # write back
-            jf.seek(0)
-            json.dump(data, jf, indent=4, ensure_ascii=False)
-            jf.truncate()
+        data = json.loads(WindowsTerminalProvider.comment_remover(raw))
+
+        # normalize profiles to dict if needed
+        profs = data.get('profiles')
+        if isinstance(profs, list):
+            data['profiles'] = {'defaults': {}, 'list': profs}
+            profs = data['profiles']
+
+        defaults = profs.setdefault('defaults', {})
+        if path is None:
+            defaults.pop('backgroundImage', None)
+        else:
+            defaults['backgroundImage'] = path
+
+        # write back via a temp file so an interrupted write can't corrupt it
+        tmp = fp + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf8') as jf:
+                json.dump(data, jf, indent=4, ensure_ascii=False)
+            os.replace(tmp, fp)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
 
     @staticmethod
     def is_compatible() -> bool:
@@ -189,10 +198,15 @@ class WallpaperAdapter:
 
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python terminalChange.py <pokemon_name_or_id|random>")
+        print("Usage: python terminalChange.py <pokemon_name_or_id|random|clear>")
         sys.exit(1)
 
     key = sys.argv[1]
+    if key.lower() in ("clear", "reset"):
+        WindowsTerminalProvider.clear()
+        print("✔ Windows Terminal background cleared.")
+        return
+
     db  = Database()
     pkm = db.get(key)
     if not pkm:
@@ -1,17 +1,27 @@
 import os
 import sys
+import atexit
 import random
-import json
 import ctypes
-import re
+import pickle
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image, ImageStat
 
+try:
+    import orjson           # optional: much faster settings.json parse/dump
+except ImportError:
+    orjson = None
+    import json             # stdlib fallback, only imported when needed
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Pokémon Database (loads Data/pokemon.txt and Images/…)
 # ──────────────────────────────────────────────────────────────────────────────
 
 class Pokemon:
+    __slots__ = ("id", "name", "region", "path", "type1", "type2", "dark_th")
+
     def __init__(self, identifier, name, region, path, pkmn_type,
                  pkmn_type_secondary, dark_threshold):
         self.id      = identifier       # zero-padded string or None for extras
@@ -23,13 +33,68 @@ class Pokemon:
         self.dark_th = float(dark_threshold)
 
 class Database:
-    """Loads all Pokémon (including extras) from local Data/ and Images/ folders."""
+    """Loads all Pokémon (including extras) from local Data/ and Images/ folders.
+
+    Rows are stored column-wise (one list per attribute); Pokemon objects are
+    only built for the rows get() actually returns.
+    """
+    REGIONS    = ("kanto", "johto", "hoenn", "sinnoh", "unova", "kalos")
+    COLUMNS    = ("_ids", "_names", "_regions", "_paths", "_type1", "_type2", "_dark")
+    CACHE_FILE = Path.home() / ".cache" / "wintermi" / "db.pkl"
+
     def __init__(self):
-        self._list    = []
-        self._by_name = {}
-        self.base     = Path(__file__).parent
-        self._load_data()
-        self._load_extra()
+        self._ids     = []              # zero-padded string or None for extras
+        self._names   = []
+        self._regions = []
+        self._paths   = []              # full path to the .jpg image or None
+        self._type1   = []
+        self._type2   = []
+        self._dark    = array("d")
+        self._by_name = {}              # name -> row
+        self._by_id   = {}              # "025" -> row
+        self._names_sorted = None       # list_names() result, reset on _register
+        self.base     = Path(__file__).resolve().parent     # image paths are absolute
+        self._extra_loaded = False      # Images/Extra is walked on demand
+        key = self._cache_key()
+        if not self._load_cache(key):
+            self._load_data()
+            self._save_cache(key)
+
+    def _cache_key(self):
+        """Base path + mtimes of pokemon.txt and the generation folders."""
+        images = self.base / "Images"
+        paths  = [self.base / "Data" / "pokemon.txt", images]
+        paths += [self._determine_folder(r) for r in self.REGIONS]
+        mtimes = []
+        for p in paths:
+            try:
+                mtimes.append(p.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return (str(self.base), *mtimes)
+
+    def _load_cache(self, key) -> bool:
+        try:
+            with self.CACHE_FILE.open("rb") as f:
+                cached_key, columns, by_name, by_id = pickle.load(f)
+        except Exception:
+            return False
+        if cached_key != key or len(columns) != len(self.COLUMNS):
+            return False
+        for attr, col in zip(self.COLUMNS, columns):
+            setattr(self, attr, col)
+        self._by_name, self._by_id = by_name, by_id
+        return True
+
+    def _save_cache(self, key):
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with self.CACHE_FILE.open("wb") as f:
+                columns = [getattr(self, attr) for attr in self.COLUMNS]
+                pickle.dump((key, columns, self._by_name, self._by_id), f,
+                            pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
 
     def _determine_region(self, idx:int):
         if idx < 152: return "kanto"
@@ -53,6 +118,14 @@ class Database:
         if not txt.exists():
             print("❌ Data/pokemon.txt not found.")
             sys.exit(1)
+        # list each generation folder once instead of stat-ing every image
+        known = {}
+        for region in self.REGIONS:
+            try:
+                with os.scandir(self._determine_folder(region)) as it:
+                    known[region] = {entry.name for entry in it}
+            except FileNotFoundError:
+                known[region] = set()
         with txt.open(encoding="utf-8") as f:
             for idx, line in enumerate(f, start=1):
                 parts = line.strip().split()
@@ -61,12 +134,17 @@ class Database:
                 t2 = parts[3] if len(parts) > 3 else ""
                 rid = f"{idx:03}"
                 region = self._determine_region(idx)
-                img = self._determine_folder(region) / f"{rid}.jpg"
-                img_path = str(img) if img.exists() else None
-                poke = Pokemon(rid, name, region, img_path, t1, t2, dark_th)
-                self._register(poke)
+                fname = f"{rid}.jpg"
+                if fname in known.get(region, ()):
+                    img_path = str(self._determine_folder(region) / fname)
+                else:
+                    img_path = None
+                self._register(rid, name, region, img_path, t1, t2, dark_th)
 
     def _load_extra(self):
+        if self._extra_loaded:
+            return
+        self._extra_loaded = True
         extra = self.base / "Images" / "Extra"
         if not extra.exists():
             return
@@ -75,106 +153,394 @@ class Database:
                 continue
             name = fn.stem.lower()
             parent = self._by_name.get(name.split('-')[0])
-            region = parent.region if parent else None
-            t1 = parent.type1 if parent else ""
-            t2 = parent.type2 if parent else ""
-            dt = parent.dark_th if parent else 0.5
-            poke = Pokemon(None, name, region, str(fn), t1, t2, dt)
-            self._register(poke)
-
-    def _register(self, poke:Pokemon):
-        self._list.append(poke)
-        self._by_name[poke.name] = poke
+            if parent is None:
+                self._register(None, name, None, str(fn), "", "", 0.5)
+            else:
+                self._register(None, name, self._regions[parent], str(fn),
+                               self._type1[parent], self._type2[parent],
+                               self._dark[parent])
+
+    def _register(self, identifier, name, region, path, t1, t2, dark_th):
+        row  = len(self._names)
+        name = name.lower()
+        self._ids.append(identifier)
+        self._names.append(name)
+        self._regions.append(region)
+        self._paths.append(path)
+        self._type1.append(t1)
+        self._type2.append(t2)
+        self._dark.append(float(dark_th))
+        self._by_name[name] = row
+        self._names_sorted  = None
+        if identifier is not None:
+            self._by_id[identifier] = row
+
+    def _row(self, row:int) -> Pokemon:
+        return Pokemon(self._ids[row], self._names[row], self._regions[row],
+                       self._paths[row], self._type1[row], self._type2[row],
+                       self._dark[row])
 
     def get(self, key):
         k = str(key).lower()
         if k == "random":
-            return random.choice(self._list)
+            self._load_extra()
+            return self._row(random.randrange(len(self._names)))
         if k.isdigit():
-            idx = int(k)
-            target = f"{idx:03}"
-            return next((p for p in self._list if p.id == target), None)
-        return self._by_name.get(k)
+            row = self._by_id.get(f"{int(k):03}")
+        else:
+            row = self._by_name.get(k)
+            if row is None:
+                self._load_extra()
+                row = self._by_name.get(k)
+        return None if row is None else self._row(row)
+
+    def get_random_attrs(self):
+        """Return (name, id, path) of a random Pokémon without building an object."""
+        self._load_extra()
+        i = random.randrange(len(self._names))
+        return self._names[i], self._ids[i], self._paths[i]
 
     def list_names(self):
-        return sorted(p.name.title() for p in self._list)
+        self._load_extra()
+        if self._names_sorted is None:
+            self._names_sorted = sorted(n.title() for n in self._names)
+        return self._names_sorted
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Image luminance helper (Pillow)
 # ──────────────────────────────────────────────────────────────────────────────
 
+LUMINANCE_CACHE = Path(__file__).parent / "Data" / "luminance.json"
+_luma_cache = None                  # path -> [mtime_ns, size, luminance]
+_luma_dirty = False
+
+def _load_luma_cache():
+    global _luma_cache
+    try:
+        raw = LUMINANCE_CACHE.read_bytes()
+        _luma_cache = orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        _luma_cache = {}
+    if not isinstance(_luma_cache, dict):
+        _luma_cache = {}
+
+def _save_luma_cache():
+    try:
+        LUMINANCE_CACHE.write_bytes(orjson.dumps(_luma_cache) if orjson
+                                    else json.dumps(_luma_cache).encode("utf8"))
+    except OSError:
+        pass
+
 def avg_luminance(img_path:str) -> float:
-    """Return 0.0 (dark) → 1.0 (bright) average luminance of the image."""
-    im = Image.open(img_path).convert("L")
-    stat = ImageStat.Stat(im)
-    return stat.mean[0] / 255.0
+    """Return 0.0 (dark) → 1.0 (bright) average luminance of the image.
+
+    Results are cached in Data/luminance.json keyed by path, mtime and size.
+    """
+    global _luma_dirty
+    if _luma_cache is None:
+        _load_luma_cache()
+    st  = os.stat(img_path)
+    hit = _luma_cache.get(img_path)
+    # anything but a [mtime_ns, size, luminance] entry is treated as a miss
+    if isinstance(hit, list) and len(hit) == 3 and isinstance(hit[2], float) \
+            and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+
+    im = Image.open(img_path)
+    im.draft("L", (128, 128))       # JPEG: let libjpeg decode at ≤1/8 scale
+    stat = ImageStat.Stat(im.convert("L"))
+    lum = stat.mean[0] / 255.0
+
+    _luma_cache[img_path] = [st.st_mtime_ns, st.st_size, lum]
+    if not _luma_dirty:
+        _luma_dirty = True
+        atexit.register(_save_luma_cache)
+    return lum
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Windows Terminal Provider
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _string_end(buf:bytes, i:int) -> int:
+    """Index of the quote closing the string literal opened at buf[i], or -1."""
+    q = buf[i]
+    j = i + 1
+    while True:
+        j = buf.find(q, j)
+        if j < 0:
+            return -1
+        k = j                           # count backslashes escaping the quote
+        while buf[k - 1] == 0x5C:
+            k -= 1
+        if (j - k) % 2 == 0:
+            return j
+        j += 1
+
+def _comment_end(buf:bytes, i:int) -> int:
+    """Index just past the comment starting at buf[i] ('/'), or -1 if none."""
+    nxt = buf[i + 1] if i + 1 < len(buf) else 0
+    if nxt == 0x2F:                     # // line comment, up to the newline
+        end = buf.find(b"\n", i + 2)
+        return len(buf) if end < 0 else end
+    if nxt == 0x2A:                     # /* block comment */
+        end = buf.find(b"*/", i + 2)
+        return -1 if end < 0 else end + 2
+    return -1
+
+def _strip_jsonc(buf:bytes) -> bytes:
+    """Replace // and /* */ comments outside of string literals with a space.
+
+    Single-pass state machine that only visits bytes able to open a string
+    or a comment: bytes.find jumps over everything else (and over string
+    and comment bodies), so no per-byte Python work and no regex backtracking.
+    """
+    if b"//" not in buf and b"/*" not in buf:
+        return buf                      # e.g. files saved by the Settings UI
+    mv  = memoryview(buf)
+    out = bytearray()
+    n   = len(buf)
+
+    def next_at(ch, i):
+        j = buf.find(ch, i)
+        return n if j < 0 else j
+
+    i = start = 0                       # start: first byte not yet copied
+    dq = sq = sl = -1                   # next '"', "'" and '/' at or after i
+    while True:
+        if dq < i: dq = next_at(b'"', i)
+        if sq < i: sq = next_at(b"'", i)
+        if sl < i: sl = next_at(b"/", i)
+        i = min(dq, sq, sl)
+        if i >= n:
+            break
+        if i == sl:                     # '/'
+            end = _comment_end(buf, i)
+            if end < 0:
+                i += 1
+                continue
+            out += mv[start:i]
+            out += b" "
+            i = start = end
+        else:                           # "…" or '…' string literal
+            j = buf.find(buf[i], i + 1)
+            if j > 0 and buf[j - 1] == 0x5C:
+                j = _string_end(buf, i) # closing quote may be escaped
+            i = i + 1 if j < 0 else j + 1
+    out += mv[start:]
+    return bytes(out)
+
+def _find_defaults(buf:bytes):
+    """Return the (start, end) byte span of the profiles.defaults object.
+
+    Walks the raw JSONC just far enough to find the block, jumping with
+    bytes.find between the bytes that matter (quotes, comments, brackets,
+    ':' and ','). Returns None if profiles is not an object, has no defaults
+    object, or lists its profiles before defaults (scanning past a large
+    list costs more than a full parse), so the caller falls back to that.
+    """
+    target = [None, b"profiles", b"defaults"]
+    keys   = []                         # key under which each open container sits
+    last   = key = None
+    start  = -1
+    n = len(buf)
+    marks = b'"/{}[]:,'
+    nxt   = [-1] * len(marks)           # next position of each mark at or after i
+    i = 0
+    while True:
+        for m, ch in enumerate(marks):
+            if nxt[m] < i:
+                j = buf.find(ch, i)
+                nxt[m] = n if j < 0 else j
+        i = min(nxt)
+        if i >= n:
+            return None
+        c = buf[i]
+        if c == 0x22:                   # '"'
+            j = _string_end(buf, i)
+            if j < 0:
+                return None
+            last = buf[i + 1:j]
+            i = j + 1
+            continue
+        if c == 0x2F:                   # '/'
+            end = _comment_end(buf, i)
+            if end > 0:
+                i = end
+                continue
+        elif c == 0x3A:                 # ':'
+            key = last
+        elif c == 0x2C:                 # ','
+            key = None
+        elif c == 0x7B or c == 0x5B:    # '{' or '['
+            keys.append(key)
+            if start < 0 and len(keys) == len(target) and keys[:2] == target[:2]:
+                if key != b"defaults" or c != 0x7B:
+                    return None         # e.g. profiles.list comes first
+                start = i
+            key = None
+        elif c == 0x7D or c == 0x5D:    # '}' or ']'
+            if start >= 0 and len(keys) == len(target):
+                return start, i + 1
+            if len(keys) <= 2 and keys == target[:len(keys)]:
+                return None             # left profiles without finding defaults
+            keys.pop()
+            key = None
+        i += 1
+
+def _indent_unit(buf:bytes, base:bytes=b""):
+    """Whitespace one level deeper than base on the first indented line, or None."""
+    for line in buf[:4096].split(b"\n")[1:]:
+        ws = line[:len(line) - len(line.lstrip())]
+        if line.strip() and len(ws) > len(base) and ws.startswith(base):
+            return ws[len(base):]
+    return None
+
+# last settings.json seen by this process: (path, mtime_ns, size, raw, span)
+_settings_cache = None
+
 class WindowsTerminalProvider:
     """Sets or clears Windows Terminal backgroundImage and foreground."""
+    SETTINGS = Path(os.getenv("LOCALAPPDATA", "")) / \
+               "Packages/Microsoft.WindowsTerminal_8wekyb3d8bbwe/LocalState/settings.json"
 
     @staticmethod
     def comment_remover(text:str) -> str:
         """Strip // and /* */ comments so JSON can parse."""
-        def repl(m):
-            s = m.group(0)
-            return " " if s.startswith('/') else s
-        pattern = re.compile(
-            r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
-            re.DOTALL|re.MULTILINE
-        )
-        return re.sub(pattern, repl, text)
+        return _strip_jsonc(text.encode("utf8")).decode("utf8")
 
     @staticmethod
-    def _load_settings():
-        fp = Path(os.getenv("LOCALAPPDATA", "")) / \
-             "Packages/Microsoft.WindowsTerminal_8wekyb3d8bbwe/LocalState/settings.json"
-        raw = fp.read_text(encoding="utf8")
-        data = json.loads(WindowsTerminalProvider.comment_remover(raw))
-        profs = data.get("profiles")
-        if isinstance(profs, list):
-            data["profiles"] = profs = {"defaults": {}, "list": profs}
-        return fp, data
+    def _parse(buf:bytes):
+        text = _strip_jsonc(buf)
+        return orjson.loads(text) if orjson else json.loads(text)
 
     @staticmethod
-    def _write_settings(fp:Path, data:dict):
-        fp.write_text(json.dumps(data, indent=4, ensure_ascii=False), encoding="utf8")
+    def _dumps(data, indent:bytes=b"", unit:bytes=None) -> bytes:
+        """Serialize data with unit per nesting level (default: 2 spaces with
+        orjson, 4 without), indenting continuation lines by indent."""
+        if orjson:
+            out = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            if unit is not None and unit != b"  ":
+                lines = out.split(b"\n")
+                for k, line in enumerate(lines):
+                    body = line.lstrip(b" ")
+                    lines[k] = unit * ((len(line) - len(body)) // 2) + body
+                out = b"\n".join(lines)
+        else:
+            out = json.dumps(data, indent=(unit or b"    ").decode(),
+                             ensure_ascii=False).encode("utf8")
+        return out.replace(b"\n", b"\n" + indent) if indent else out
+
+    @staticmethod
+    def _read_settings(fp:Path):
+        """Return (raw, defaults span), reusing the last read while the file
+        is unchanged on disk."""
+        global _settings_cache
+        st = fp.stat()
+        if _settings_cache and _settings_cache[:3] == (fp, st.st_mtime_ns, st.st_size):
+            return _settings_cache[3:]
+        raw  = fp.read_bytes()
+        span = _find_defaults(raw)
+        _settings_cache = (fp, st.st_mtime_ns, st.st_size, raw, span)
+        return raw, span
+
+    @staticmethod
+    def _write_settings(fp:Path, buf:bytes, span=None):
+        """Write via a sibling temp file + os.replace so settings.json is never
+        left half-written if the process dies mid-write."""
+        global _settings_cache
+        real = fp.resolve()             # keep a symlinked settings.json a symlink
+        tmp  = real.with_name(real.name + ".tmp")
+        try:
+            tmp.write_bytes(buf)
+            os.replace(tmp, real)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        if span is None:
+            span = _find_defaults(buf)
+        st = fp.stat()
+        _settings_cache = (fp, st.st_mtime_ns, st.st_size, buf, span)
+
+    @staticmethod
+    def _edit_defaults(edit):
+        """Apply edit(defaults) to profiles.defaults in settings.json.
+
+        Only the defaults block is re-serialized and spliced back into the raw
+        file; the rest (other profiles, comments, formatting) is left as is.
+        Files where the block cannot be located are rewritten in full.
+        """
+        fp = WindowsTerminalProvider.SETTINGS
+        raw, span = WindowsTerminalProvider._read_settings(fp)
+        if span is None:
+            data  = WindowsTerminalProvider._parse(raw)
+            profs = data.get("profiles")
+            if isinstance(profs, list):
+                profs = {"list": profs}
+            # put defaults first so the next run finds it without a full parse
+            defaults = profs.get("defaults", {})
+            data["profiles"] = {"defaults": defaults, **profs}
+            edit(defaults)
+            unit = _indent_unit(raw) or b"    "
+            buf  = WindowsTerminalProvider._dumps(data, b"", unit)
+
+            # defaults is now the first key of the top-level profiles object,
+            # so its span follows from the serialized layout
+            head = b"\n" + unit + b'"profiles": {\n' + unit * 2 + b'"defaults": '
+            pos  = buf.find(head)
+            span = None
+            if pos >= 0:
+                start = pos + len(head)
+                block = WindowsTerminalProvider._dumps(defaults, unit * 2, unit)
+                span  = (start, start + len(block))
+            WindowsTerminalProvider._write_settings(fp, buf, span)
+            return
+
+        start, end = span
+        defaults = WindowsTerminalProvider._parse(raw[start:end])
+        edit(defaults)
+        line = raw[raw.rfind(b"\n", 0, start) + 1:start]
+        indent = line[:len(line) - len(line.lstrip())]
+        # match the file's indentation (Windows Terminal itself uses 4 spaces)
+        unit = _indent_unit(raw[start:end], indent) or _indent_unit(raw) or b"    "
+        block = WindowsTerminalProvider._dumps(defaults, indent, unit)
+        if b"\r\n" in raw:
+            block = block.replace(b"\n", b"\r\n")
+        WindowsTerminalProvider._write_settings(
+            fp, raw[:start] + block + raw[end:], (start, start + len(block)))
 
     @staticmethod
     def set_background_image(path:str):
         """Set backgroundImage + auto‐contrast foreground in profiles.defaults."""
-        fp, data = WindowsTerminalProvider._load_settings()
-        defaults = data["profiles"].setdefault("defaults", {})
+        # compute luminance before touching settings.json
+        fg = None
+        if path and Path(path).exists():
+            fg = "#000000" if avg_luminance(path) > 0.5 else "#FFFFFF"
 
-        # remove colorScheme so raw foreground is honored
-        defaults.pop("colorScheme", None)
+        def edit(defaults):
+            # remove colorScheme so raw foreground is honored
+            defaults.pop("colorScheme", None)
 
-        # set or clear backgroundImage
-        if path:
-            defaults["backgroundImage"] = path
-        else:
-            defaults.pop("backgroundImage", None)
+            # set or clear backgroundImage
+            if path:
+                defaults["backgroundImage"] = path
+            else:
+                defaults.pop("backgroundImage", None)
 
-        # compute luminance & override foreground
-        if path and Path(path).exists():
-            lum = avg_luminance(path)
-            defaults["foreground"] = "#000000" if lum > 0.5 else "#FFFFFF"
-        else:
-            defaults.pop("foreground", None)
+            # override foreground for contrast
+            if fg:
+                defaults["foreground"] = fg
+            else:
+                defaults.pop("foreground", None)
 
-        WindowsTerminalProvider._write_settings(fp, data)
+        WindowsTerminalProvider._edit_defaults(edit)
 
     @staticmethod
     def clear():
         """Remove backgroundImage, foreground, and colorScheme overrides."""
-        fp, data = WindowsTerminalProvider._load_settings()
-        defaults = data["profiles"].setdefault("defaults", {})
-        for key in ("backgroundImage", "foreground", "colorScheme"):
-            defaults.pop(key, None)
-        WindowsTerminalProvider._write_settings(fp, data)
+        def edit(defaults):
+            for key in ("backgroundImage", "foreground", "colorScheme"):
+                defaults.pop(key, None)
+        WindowsTerminalProvider._edit_defaults(edit)
 
     @staticmethod
     def is_compatible() -> bool:
@@ -187,13 +553,18 @@ class WindowsTerminalProvider:
 class WallpaperAdapter:
     @staticmethod
     def set(path:str) -> bool:
-        if not path or not Path(path).exists():
+        # the database only hands out paths that existed at load time; a file
+        # removed since then makes SystemParametersInfoW return 0
+        if not path:
             print("  ⚠️ image not found:", path)
             return False
         SPI_SETDESKWALLPAPER = 20
         try:
-            return bool(ctypes.windll.user32.SystemParametersInfoW(
-                SPI_SETDESKWALLPAPER, 0, str(Path(path).absolute()), 3))
+            ok = bool(ctypes.windll.user32.SystemParametersInfoW(
+                SPI_SETDESKWALLPAPER, 0, path, 3))
+            if not ok:
+                print("  ⚠️ could not set wallpaper:", path)
+            return ok
         except Exception as e:
             print("  ❌ Wallpaper error:", e)
             return False
@@ -214,25 +585,34 @@ def main():
         print("✔ Windows Terminal overrides cleared.")
         sys.exit(0)
 
-    db  = Database()
-    pkm = db.get(cmd)
-    if not pkm:
-        print(f"❌ Pokémon '{cmd}' not found.")
-        print("▶︎ Available examples:", ", ".join(db.list_names()[:10]), "…")
-        sys.exit(1)
+    db = Database()
+    if cmd == "random":
+        name, pid, path = db.get_random_attrs()
+    else:
+        pkm = db.get(cmd)
+        if not pkm:
+            print(f"❌ Pokémon '{cmd}' not found.")
+            print("▶︎ Available examples:", ", ".join(db.list_names()[:10]), "…")
+            sys.exit(1)
+        name, pid, path = pkm.name, pkm.id, pkm.path
 
-    print(f"► Applying theme: {pkm.name.title()} (#{pkm.id or 'XX'})")
+    print(f"► Applying theme: {name.title()} (#{pid or 'XX'})")
 
-    # 1) desktop wallpaper
-    ok_wp = WallpaperAdapter.set(pkm.path)
-    print("  Wallpaper:", "✔" if ok_wp else "✗")
+    # desktop wallpaper and Windows Terminal are independent: apply both at once
+    wt = WindowsTerminalProvider.is_compatible()
+    with ThreadPoolExecutor(2) as ex:
+        f_wp = ex.submit(WallpaperAdapter.set, path)
+        f_wt = ex.submit(WindowsTerminalProvider.set_background_image, path) if wt else None
 
-    # 2) Windows Terminal
-    if WindowsTerminalProvider.is_compatible():
-        WindowsTerminalProvider.set_background_image(pkm.path)
-        print("  Terminal :", "✔")
-    else:
-        print("  Terminal : ⚠️ not a Windows Terminal session")
+        # report the wallpaper first, even if the terminal update fails below
+        ok_wp = f_wp.result()
+        print("  Wallpaper:", "✔" if ok_wp else "✗")
+
+        if f_wt:
+            f_wt.result()
+            print("  Terminal :", "✔")
+        else:
+            print("  Terminal : ⚠️ not a Windows Terminal session")
 
     print("✔ Done!" if ok_wp else "✗ Completed with errors")
 
@@ -0,0 +1,45 @@
+import random
+import re
+
+import pytest
+
+from terminalChange import WindowsTerminalProvider, _strip_jsonc
+
+# the regex comment_remover used before the state-machine rewrite
+OLD_PATTERN = re.compile(
+    r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
+    re.DOTALL|re.MULTILINE
+)
+
+def old_comment_remover(text:str) -> str:
+    return OLD_PATTERN.sub(lambda m: " " if m.group(0).startswith('/') else m.group(0), text)
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": 1}',
+    '{"url": "https://example.com"} // trailing',
+    '{"a": /* inline */ 1}\n// last line',
+    '{"s": "a \\" // still a string"}',
+    '{"s": "ends with backslash \\\\"} // comment',
+    "{'single': 'it''s // here'}",
+    '/* unterminated block',
+    '"unterminated string // with comment',
+    '{\r\n  // crlf comment\r\n  "a": 1\r\n}',
+    '{"ünï": "cödé"} /* é */',
+])
+def test_strip_matches_old_regex(text):
+    assert _strip_jsonc(text.encode("utf8")).decode("utf8") == old_comment_remover(text)
+    assert WindowsTerminalProvider.comment_remover(text) == old_comment_remover(text)
+
+
+def test_strip_matches_old_regex_randomized():
+    rng = random.Random(1611)
+    alphabet = ['/', '*', '"', "'", '\\', '\n', '\r', 'a', '{', '}', ' ', 'é']
+    for _ in range(30000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert _strip_jsonc(text.encode("utf8")).decode("utf8") == old_comment_remover(text), text
+
+
+def test_strip_without_comments_returns_input():
+    buf = b'{"a": "b/c", "d": [1, 2]}'
+    assert _strip_jsonc(buf) is buf
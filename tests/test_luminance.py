@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import terminalChange as tc
+
+IMG = str(tc.Path(tc.__file__).resolve().parent / "Images" / "Generation I - Kanto" / "025.jpg")
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Isolate the luminance cache; nothing is written at exit."""
+    monkeypatch.setattr(tc, "LUMINANCE_CACHE", tmp_path / "luminance.json")
+    monkeypatch.setattr(tc, "_luma_dirty", True)
+    monkeypatch.setattr(tc, "_luma_cache", {})
+    return tc._luma_cache
+
+
+def test_luminance_is_cached(cache):
+    lum = tc.avg_luminance(IMG)
+    st = os.stat(IMG)
+    assert cache[IMG] == [st.st_mtime_ns, st.st_size, lum]
+    cache[IMG][2] = 0.25
+    assert tc.avg_luminance(IMG) == 0.25
+
+
+@pytest.mark.parametrize("entry", [
+    "junk", 0.5, None, {}, [], [1, 2], ["a", "b", "c", "d"], [None, None, "x"],
+])
+def test_malformed_entry_is_a_miss(cache, entry):
+    expected = tc.avg_luminance(IMG)
+    cache[IMG] = entry
+    assert tc.avg_luminance(IMG) == expected
+
+
+@pytest.mark.parametrize("tail", [[], ["0.25"], [None], [0.25, 1]])
+def test_truncated_entry_for_current_file_is_a_miss(cache, tail):
+    expected = tc.avg_luminance(IMG)
+    st = os.stat(IMG)
+    cache[IMG] = [st.st_mtime_ns, st.st_size, *tail]
+    assert tc.avg_luminance(IMG) == expected
+
+
+def test_stale_entry_is_a_miss(cache):
+    expected = tc.avg_luminance(IMG)
+    cache[IMG][0] -= 1
+    cache[IMG][2] = 0.25
+    assert tc.avg_luminance(IMG) == expected
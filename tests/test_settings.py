@@ -0,0 +1,231 @@
+import json
+
+import pytest
+
+import terminalChange as tc
+from terminalChange import WindowsTerminalProvider as WT
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    """Run each test with orjson and with the stdlib json fallback."""
+    if request.param == "orjson":
+        if tc.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(tc, "orjson", None)
+        monkeypatch.setattr(tc, "json", json, raising=False)
+    return request.param
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """Point the provider at a temp settings.json; returns a writer."""
+    fp = tmp_path / "settings.json"
+    monkeypatch.setattr(WT, "SETTINGS", fp)
+    monkeypatch.setattr(tc, "_settings_cache", None)
+
+    def write(text):
+        fp.write_bytes(text.encode("utf8") if isinstance(text, str) else text)
+        return fp
+    return write
+
+
+def set_bg(defaults):
+    defaults.pop("colorScheme", None)
+    defaults["backgroundImage"] = "C:/img.jpg"
+
+
+def block(buf, span):
+    return buf[span[0]:span[1]]
+
+
+def assert_cache_matches(fp):
+    """The span cached after a write is what a fresh scan would find."""
+    buf = fp.read_bytes()
+    assert tc._settings_cache[3] == buf
+    assert tc._settings_cache[4] == tc._find_defaults(buf)
+
+
+# ── _string_end / _comment_end ───────────────────────────────────────────────
+
+@pytest.mark.parametrize("buf, end", [
+    (b'"abc" x', 4),
+    (b'"a\\"b" x', 5),
+    (b'"a\\\\" x', 4),
+    (b'"a\\\\\\"b" x', 7),
+    (b"'it''s'", 3),
+    (b'"open', -1),
+])
+def test_string_end(buf, end):
+    assert tc._string_end(buf, 0) == end
+
+
+@pytest.mark.parametrize("buf, end", [
+    (b"// line\nx", 7),
+    (b"// to eof", 9),
+    (b"/* a */x", 7),
+    (b"/* open", -1),
+    (b"/x", -1),
+    (b"/", -1),
+])
+def test_comment_end(buf, end):
+    assert tc._comment_end(buf, 0) == end
+
+
+# ── _find_defaults ───────────────────────────────────────────────────────────
+
+def test_find_defaults_before_list():
+    buf = b'{"profiles": {"defaults": {"a": 1}, "list": [{"b": 2}]}}'
+    assert block(buf, tc._find_defaults(buf)) == b'{"a": 1}'
+
+
+@pytest.mark.parametrize("buf", [
+    b'{"profiles": {"list": [{"defaults": {}}], "defaults": {"a": 1}}}',
+    b'{"profiles": {"list": []}}',
+    b'{"profiles": [{"defaults": {"a": 1}}]}',
+    b'{"profiles": {"defaults": null, "list": []}}',
+    b'{"defaults": {"a": 1}}',
+], ids=["after-list", "missing", "list-style", "not-an-object", "top-level"])
+def test_find_defaults_falls_back(buf):
+    assert tc._find_defaults(buf) is None
+
+
+def test_find_defaults_ignores_nested_profiles_key():
+    buf = b'{"x": {"profiles": {"defaults": {"no": 1}}}, "profiles": {"defaults": {"yes": 1}}}'
+    assert block(buf, tc._find_defaults(buf)) == b'{"yes": 1}'
+
+
+def test_find_defaults_skips_tricky_strings():
+    buf = (b'{"name": "a { b [ c", "profiles": {"defaults": '
+           b'{"s": "} ] \\" // not /* a comment", "t": "\\\\"}, "list": []}}')
+    span = tc._find_defaults(buf)
+    assert json.loads(block(buf, span)) == {"s": '} ] " // not /* a comment', "t": "\\"}
+
+
+def test_find_defaults_skips_comments_with_quotes():
+    buf = b'''// don't "break" here
+{
+    /* "profiles": {"defaults": {"fake": 1}} */
+    "profiles": {
+        // "quoted" { brace
+        "defaults": { "a": 1 /* it's } */ },
+        "list": []
+    }
+}'''
+    assert block(buf, tc._find_defaults(buf)) == b'{ "a": 1 /* it\'s } */ }'
+
+
+def test_find_defaults_minified():
+    buf = b'{"a":[1,{"b":"}"}],"profiles":{"defaults":{"c":{"d":[]}},"list":[]}}'
+    assert block(buf, tc._find_defaults(buf)) == b'{"c":{"d":[]}}'
+
+
+# ── _edit_defaults ───────────────────────────────────────────────────────────
+
+WT_FILE = '''// user comment
+{
+    "$schema": "https://aka.ms/terminal-profiles-schema",
+    "profiles":
+    {
+        "defaults":
+        {
+            "colorScheme": "Campbell",
+            "font": { "face": "Cascadia Mono" }
+        },
+        "list":
+        [
+            { "name": "cmd // not a comment", "commandline": "cmd.exe" } // trailing
+        ]
+    },
+    "schemes": [] /* block */
+}
+'''
+
+
+def test_edit_splices_only_defaults(codec, settings):
+    fp = settings(WT_FILE)
+    WT._edit_defaults(set_bg)
+    out = fp.read_text(encoding="utf8")
+
+    head, tail = WT_FILE.split('        "defaults":\n        {', 1)
+    assert out.startswith(head)
+    assert out.endswith(tail[tail.index('        "list":'):])
+    assert '''        "defaults":
+        {
+            "font": {
+                "face": "Cascadia Mono"
+            },
+            "backgroundImage": "C:/img.jpg"
+        },
+''' in out
+    assert_cache_matches(fp)
+
+
+@pytest.mark.parametrize("profiles", [
+    {"list": [{"name": "a"}], "defaults": {"colorScheme": "x", "k": 1}},
+    {"list": [{"name": "a"}]},
+    [{"name": "a"}],
+], ids=["after-list", "missing", "list-style"])
+def test_edit_rewrites_with_defaults_first(codec, settings, profiles):
+    fp = settings("// c\n" + json.dumps({"a": 1, "profiles": profiles}, indent=4))
+    WT._edit_defaults(set_bg)
+    out = fp.read_bytes()
+
+    data = json.loads(out)
+    assert list(data["profiles"])[0] == "defaults"
+    assert data["profiles"]["defaults"]["backgroundImage"] == "C:/img.jpg"
+    assert "colorScheme" not in data["profiles"]["defaults"]
+    assert data["profiles"]["list"] == [{"name": "a"}]
+    assert b'\n    "profiles": {\n        "defaults": {' in out    # 4-space kept
+    assert_cache_matches(fp)
+
+    # the next edit takes the splice path
+    assert tc._find_defaults(out) is not None
+
+
+def test_edit_keeps_crlf(codec, settings):
+    fp = settings(WT_FILE.replace("\n", "\r\n"))
+    WT._edit_defaults(set_bg)
+    out = fp.read_bytes()
+    assert b"\n" not in out.replace(b"\r\n", b"")
+    assert b'"backgroundImage": "C:/img.jpg"\r\n' in out
+    assert_cache_matches(fp)
+
+
+def test_edit_keeps_tab_indent(codec, settings):
+    text = json.dumps({"profiles": {"defaults": {"f": {"a": 1}}, "list": []}}, indent="\t")
+    fp = settings(text)
+    WT._edit_defaults(set_bg)
+    out = fp.read_text(encoding="utf8")
+    assert out == json.dumps({"profiles": {"defaults": {"f": {"a": 1}, "backgroundImage": "C:/img.jpg"},
+                                           "list": []}}, indent="\t")
+    assert_cache_matches(fp)
+
+
+def test_edit_minified(codec, settings):
+    fp = settings('{"profiles":{"defaults":{},"list":[{"name":"a"}]}}')
+    WT._edit_defaults(set_bg)
+    out = fp.read_bytes()
+    assert json.loads(out) == {"profiles": {"defaults": {"backgroundImage": "C:/img.jpg"},
+                                            "list": [{"name": "a"}]}}
+    assert out.endswith(b',"list":[{"name":"a"}]}}')
+    assert_cache_matches(fp)
+
+
+def test_clear_twice_is_stable(codec, settings):
+    fp = settings(WT_FILE)
+    WT._edit_defaults(set_bg)
+    WT.clear()
+    once = fp.read_bytes()
+    WT.clear()
+    assert fp.read_bytes() == once
+    assert "backgroundImage" not in json.loads(tc._strip_jsonc(once))["profiles"]["defaults"]
+
+
+def test_external_change_invalidates_cache(codec, settings):
+    fp = settings(WT_FILE)
+    WT._edit_defaults(set_bg)
+    fp.write_text('{"profiles": {"defaults": {"b": 2}, "list": []}}', encoding="utf8")
+    WT.clear()
+    assert json.loads(fp.read_bytes())["profiles"]["defaults"] == {"b": 2}